@@ -3,14 +3,22 @@ Unit tests for wireless sensor application
 Tests cover all negative test cases and edge scenarios
 """
 
+import queue
+import threading
+import time
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from collections import namedtuple
+from unittest.mock import patch, call, MagicMock, PropertyMock
 import serial
 from wireless_sensor import (
-    SensorErrorType, SensorData, RTDTemperatureTable, SerialPortManager,
-    PacketProcessor, SensorDataParser
+    SensorErrorType, SensorData, SensorFrameBuffer, RTDTemperatureTable,
+    ThermocoupleTable, SerialPortManager, PacketProcessor, SensorDataParser,
+    DashboardFrame, SensorGUI
 )
 
+_Port = namedtuple('_Port', ['device', 'description'])
+_RAW16 = tuple(range(16))
+
 
 class TestSensorData(unittest.TestCase):
     """Test SensorData validation"""
@@ -24,7 +32,7 @@ class TestSensorData(unittest.TestCase):
             rtd_temperature=50,
             thermocouple=15.5,
             battery_voltage=3.7,
-            raw_packet=list(range(18))
+            raw_packet=_RAW16
         )
         self.assertTrue(data.is_valid())
     
@@ -37,7 +45,7 @@ class TestSensorData(unittest.TestCase):
             rtd_temperature=50,
             thermocouple=15.5,
             battery_voltage=3.7,
-            raw_packet=list(range(18))
+            raw_packet=_RAW16
         )
         self.assertFalse(data.is_valid())
     
@@ -50,7 +58,7 @@ class TestSensorData(unittest.TestCase):
             rtd_temperature=50,
             thermocouple=15.5,
             battery_voltage=15.0,  # Too high
-            raw_packet=list(range(18))
+            raw_packet=_RAW16
         )
         self.assertFalse(data.is_valid())
     
@@ -63,7 +71,7 @@ class TestSensorData(unittest.TestCase):
             rtd_temperature=50,
             thermocouple=15.5,
             battery_voltage=-1.0,  # Negative
-            raw_packet=list(range(18))
+            raw_packet=_RAW16
         )
         self.assertFalse(data.is_valid())
     
@@ -89,18 +97,88 @@ class TestSensorData(unittest.TestCase):
             rtd_temperature=50,
             thermocouple=15.5,
             battery_voltage=3.7,
-            raw_packet=list(range(18))
+            raw_packet=_RAW16
         )
         self.assertFalse(data.is_valid())
 
 
+class TestSensorFrameBuffer(unittest.TestCase):
+    """Test column-wise sensor reading buffer"""
+    
+    def make_data(self, temperature, battery_voltage=3.7):
+        return SensorData(
+            temperature=temperature,
+            device_id="01 02 03 04",
+            rtd_resistance=100.0,
+            rtd_temperature=0,
+            thermocouple=0.5,
+            battery_voltage=battery_voltage,
+            rssi=60,
+            raw_packet=list(range(16))
+        )
+    
+    def test_invalid_capacity(self):
+        """Test non-positive capacity is rejected"""
+        with self.assertRaises(ValueError):
+            SensorFrameBuffer(0)
+    
+    def test_append_in_order(self):
+        """Test readings are returned oldest first"""
+        buffer = SensorFrameBuffer(4)
+        for temp in (1.0, 2.0, 3.0):
+            buffer.append(self.make_data(temp))
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer.column('temperature'), [1.0, 2.0, 3.0])
+        self.assertEqual(buffer.column('device_id'), ["01 02 03 04"] * 3)
+    
+    def test_wraparound_overwrites_oldest(self):
+        """Test full buffer drops the oldest reading"""
+        buffer = SensorFrameBuffer(3)
+        for temp in (1.0, 2.0, 3.0, 4.0, 5.0):
+            buffer.append(self.make_data(temp))
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer.column('temperature'), [3.0, 4.0, 5.0])
+    
+    def test_valid_mask(self):
+        """Test batch battery range validation"""
+        buffer = SensorFrameBuffer(4)
+        buffer.append(self.make_data(1.0, battery_voltage=3.7))
+        buffer.append(self.make_data(2.0, battery_voltage=12.0))
+        self.assertEqual(buffer.valid_mask(), [True, False])
+    
+    def test_battery_stored_as_millivolts(self):
+        """Test battery voltage round-trips through fixed-point millivolts"""
+        buffer = SensorFrameBuffer(2)
+        buffer.append(self.make_data(1.0, battery_voltage=10.0))
+        buffer.append(self.make_data(2.0, battery_voltage=3.301))
+        self.assertEqual(buffer.column('battery_voltage_mv'), [10000, 3301])
+        self.assertEqual(buffer.column('battery_voltage'), [10.0, 3.301])
+        self.assertEqual(buffer.valid_mask(), [True, True])
+    
+    def test_out_of_range_battery_kept_invalid(self):
+        """Test negative and above-16-bit voltages stay invalid after clamping to the column"""
+        buffer = SensorFrameBuffer(2)
+        buffer.append(self.make_data(1.0, battery_voltage=-1.0))
+        buffer.append(self.make_data(2.0, battery_voltage=70.0))
+        self.assertEqual(buffer.valid_mask(), [False, False])
+        self.assertEqual(buffer.column('battery_voltage_mv'), [0, 0xFFFF])
+    
+    def test_clear(self):
+        """Test clearing the buffer"""
+        buffer = SensorFrameBuffer(2)
+        buffer.append(self.make_data(1.0))
+        buffer.clear()
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(buffer.column('temperature'), [])
+
+
 class TestRTDTemperatureTable(unittest.TestCase):
     """Test RTD temperature conversion"""
     
     def test_valid_rtd_conversion(self):
         """Test valid RTD resistance to temperature conversion"""
         temp = RTDTemperatureTable.get_temperature_from_resistance(100.0)
-        self.assertIsInstance(temp, int)
+        self.assertIsInstance(temp, float)
     
     def test_invalid_rtd_type(self):
         """Test invalid RTD resistance type"""
@@ -115,19 +193,67 @@ class TestRTDTemperatureTable(unittest.TestCase):
     def test_zero_rtd_resistance(self):
         """Test zero RTD resistance"""
         temp = RTDTemperatureTable.get_temperature_from_resistance(0.0)
-        self.assertIsInstance(temp, int)
+        self.assertIsInstance(temp, float)
     
     def test_extreme_rtd_value(self):
         """Test extremely high RTD value"""
         temp = RTDTemperatureTable.get_temperature_from_resistance(1000.0)
-        self.assertIsInstance(temp, int)
+        self.assertIsInstance(temp, float)
+    
+    def test_rtd_callendar_van_dusen_points(self):
+        """Test IEC 60751 Pt100 reference points above 0 degC"""
+        for resistance, expected in ((100.0, 0), (138.5055, 100), (194.0981, 250),
+                                     (280.9775, 500), (390.4811, 850)):
+            self.assertAlmostEqual(RTDTemperatureTable.get_temperature_from_resistance(resistance), expected, places=3)
+    
+    def test_rtd_table_monotonic(self):
+        """Test generated table is strictly increasing over -200..850 degC"""
+        values = RTDTemperatureTable.rtd_values
+        self.assertEqual(len(values), 1051)
+        self.assertTrue(all(a < b for a, b in zip(values, values[1:])))
+        self.assertAlmostEqual(RTDTemperatureTable.get_temperature_from_resistance(60.2558), -100, places=3)
+    
+    def test_rtd_interpolates_between_entries(self):
+        """Test sub-degree resolution between table entries"""
+        halfway = (RTDTemperatureTable.rtd_values[150] + RTDTemperatureTable.rtd_values[151]) / 2
+        self.assertAlmostEqual(RTDTemperatureTable.get_temperature_from_resistance(halfway), -49.5, places=2)
+        self.assertAlmostEqual(RTDTemperatureTable.get_temperature_from_resistance(100.5), 1.28, places=2)
+    
+    def test_rtd_above_range_clamped(self):
+        """Test resistance beyond 850 degC clamps to the range limit"""
+        self.assertEqual(RTDTemperatureTable.get_temperature_from_resistance(1000.0), 850)
+
+
+class TestThermocoupleTable(unittest.TestCase):
+    """Test thermocouple temperature conversion"""
+    
+    def test_invalid_voltage_type(self):
+        """Test invalid thermocouple voltage type"""
+        with self.assertRaises(ValueError):
+            ThermocoupleTable.get_temperature_from_voltage("1.0")
+    
+    def test_nearest_entry(self):
+        """Test lookups return the first matching table temperature"""
+        self.assertEqual(ThermocoupleTable.get_temperature_from_voltage(0.0), -50)
+        self.assertEqual(ThermocoupleTable.get_temperature_from_voltage(0.074), 100)
+        self.assertEqual(ThermocoupleTable.get_temperature_from_voltage(100.0), 1951)
+    
+    def test_tie_prefers_lower_temperature(self):
+        """Test a voltage midway between entries resolves to the lower temperature"""
+        self.assertEqual(ThermocoupleTable.get_temperature_from_voltage(-0.0025), -42)
 
 
 class TestSerialPortManager(unittest.TestCase):
     """Test serial port management"""
     
+    @classmethod
+    def setUpClass(cls):
+        cls.serial_factory = MagicMock()
+        cls.manager = SerialPortManager(serial_factory=cls.serial_factory)
+    
     def setUp(self):
-        self.manager = SerialPortManager()
+        self.serial_factory.reset_mock(return_value=True, side_effect=True)
+        self.manager.reset()
     
     @patch('serial.tools.list_ports.comports')
     def test_get_available_ports_empty(self, mock_comports):
@@ -139,18 +265,42 @@ class TestSerialPortManager(unittest.TestCase):
     @patch('serial.tools.list_ports.comports')
     def test_get_available_ports_multiple(self, mock_comports):
         """Test getting multiple available ports"""
-        mock_port1 = Mock()
-        mock_port1.device = "COM1"
-        mock_port1.description = "USB Serial Port"
-        
-        mock_port2 = Mock()
-        mock_port2.device = "COM2"
-        mock_port2.description = "Arduino"
-        
-        mock_comports.return_value = [mock_port1, mock_port2]
+        mock_comports.return_value = [
+            _Port("COM1", "USB Serial Port"),
+            _Port("COM2", "Arduino"),
+        ]
         ports = self.manager.get_available_ports()
         self.assertEqual(len(ports), 2)
     
+    @patch('serial.tools.list_ports.comports')
+    def test_get_available_ports_cached(self, mock_comports):
+        """Test repeated scans within the cache window reuse the result"""
+        mock_comports.return_value = [_Port("COM1", "USB Serial Port")]
+        first = self.manager.get_available_ports()
+        second = self.manager.get_available_ports()
+        self.assertEqual(first, second)
+        mock_comports.assert_called_once()
+        
+        self.manager._ports_time -= SerialPortManager.PORTS_CACHE_TTL
+        self.manager.get_available_ports()
+        self.assertEqual(mock_comports.call_count, 2)
+        
+        self.manager.close_port()
+        self.manager.get_available_ports()
+        self.assertEqual(mock_comports.call_count, 3)
+    
+    @patch('serial.tools.list_ports.comports')
+    def test_invalidate_during_scan_discards_result(self, mock_comports):
+        """Test a scan that overlaps an invalidation does not repopulate the cache"""
+        def comports():
+            self.manager.invalidate_ports()  # e.g. close_port on the Tk thread mid-scan
+            return [_Port("COM1", "USB Serial Port")]
+        
+        mock_comports.side_effect = comports
+        self.assertEqual(self.manager.get_available_ports(), ["COM1 - USB Serial Port"])
+        self.manager.get_available_ports()
+        self.assertEqual(mock_comports.call_count, 2)
+    
     def test_open_port_empty_string(self):
         """Test opening empty port string"""
         success, msg = self.manager.open_port("")
@@ -162,41 +312,387 @@ class TestSerialPortManager(unittest.TestCase):
         success, msg = self.manager.open_port("   ")
         self.assertFalse(success)
     
-    @patch('serial.Serial')
-    def test_open_port_serial_exception(self, mock_serial):
+    def test_open_port_serial_exception(self):
         """Test serial port exception handling"""
-        mock_serial.side_effect = serial.SerialException("Device not found")
+        self.serial_factory.side_effect = serial.SerialException("Device not found")
         success, msg = self.manager.open_port("COM1 - USB")
         self.assertFalse(success)
         self.assertIn("error", msg.lower())
     
-    @patch('serial.Serial')
-    def test_open_port_success(self, mock_serial):
+    def test_open_port_success(self):
         """Test successful port opening"""
-        mock_serial.return_value = MagicMock()
+        self.serial_factory.return_value = MagicMock()
+        success, msg = self.manager.open_port("COM1 - USB")
+        self.assertTrue(success)
+    
+    def test_open_port_enables_low_latency(self):
+        """Test low latency mode is requested and its failure does not fail the open"""
+        mock_ser = MagicMock()
+        mock_ser.set_low_latency_mode.side_effect = ValueError("unsupported")
+        self.serial_factory.return_value = mock_ser
         success, msg = self.manager.open_port("COM1 - USB")
         self.assertTrue(success)
+        mock_ser.set_low_latency_mode.assert_called_once_with(True)
     
     def test_close_port_not_open(self):
         """Test closing port when not open"""
         success, msg = self.manager.close_port()
         self.assertFalse(success)
     
+    def test_close_port_after_read_error(self):
+        """Test a port marked closed by a failed read still releases its handle"""
+        mock_ser = MagicMock()
+        mock_ser.in_waiting = 0
+        mock_ser.read.side_effect = serial.SerialException("device removed")
+        self.serial_factory.return_value = mock_ser
+        self.manager.open_port("COM1 - USB")
+        self.manager.read_available()
+        self.assertFalse(self.manager.is_open)
+        
+        success, msg = self.manager.close_port()
+        self.assertTrue(success)
+        mock_ser.close.assert_called_once_with()
+        self.assertIsNone(self.manager.ser)
+    
     def test_read_byte_not_open(self):
         """Test reading byte when port not open"""
         data = self.manager.read_byte()
         self.assertIsNone(data)
     
-    @patch('serial.Serial')
-    def test_read_byte_serial_exception(self, mock_serial):
+    def test_read_byte_serial_exception(self):
         """Test read error handling"""
         mock_ser = MagicMock()
         mock_ser.read.side_effect = serial.SerialException("Read error")
-        mock_serial.return_value = mock_ser
+        self.serial_factory.return_value = mock_ser
         
         self.manager.open_port("COM1 - USB")
         data = self.manager.read_byte()
         self.assertIsNone(data)
+    
+    def test_read_available_not_open(self):
+        """Test bulk read when port not open"""
+        data = self.manager.read_available()
+        self.assertEqual(data, b"")
+    
+    def test_read_available_drains_waiting(self):
+        """Test bulk read requests all waiting bytes"""
+        mock_ser = MagicMock()
+        mock_ser.in_waiting = 5
+        mock_ser.read.return_value = b"abcde"
+        self.serial_factory.return_value = mock_ser
+        
+        self.manager.open_port("COM1 - USB")
+        data = self.manager.read_available()
+        self.assertEqual(data, b"abcde")
+        mock_ser.read.assert_called_once_with(5)
+    
+    def test_read_available_blocks_then_drains(self):
+        """Test bulk read waits for one byte then drains the rest of the burst"""
+        mock_ser = MagicMock()
+        type(mock_ser).in_waiting = PropertyMock(side_effect=[0, 4])
+        mock_ser.read.side_effect = [b"a", b"bcde"]
+        self.serial_factory.return_value = mock_ser
+        
+        self.manager.open_port("COM1 - USB")
+        self.assertEqual(self.manager.read_available(), b"abcde")
+        self.assertEqual(mock_ser.read.call_args_list, [call(1), call(4)])
+    
+    def test_read_available_serial_exception(self):
+        """Test bulk read error handling"""
+        mock_ser = MagicMock()
+        mock_ser.in_waiting = 0
+        mock_ser.read.side_effect = serial.SerialException("Read error")
+        self.serial_factory.return_value = mock_ser
+        
+        self.manager.open_port("COM1 - USB")
+        data = self.manager.read_available()
+        self.assertEqual(data, b"")
+        self.assertFalse(self.manager.is_open)
+    
+    def test_reset_closes_port(self):
+        """Test reset releases an open port and is idempotent"""
+        mock_ser = MagicMock()
+        self.serial_factory.return_value = mock_ser
+        
+        self.manager.open_port("COM1 - USB")
+        self.manager.reset()
+        mock_ser.close.assert_called_once()
+        self.assertIsNone(self.manager.ser)
+        self.assertFalse(self.manager.is_open)
+        self.manager.reset()
+
+
+class TestParallelReader(unittest.TestCase):
+    """Test background serial reader thread"""
+    
+    def setUp(self):
+        self.serial_factory = MagicMock()
+        self.manager = SerialPortManager(serial_factory=self.serial_factory)
+        self.manager.OPEN_SETTLE_S = 0
+    
+    def test_start_reader_not_open(self):
+        """Test reader does not start without an open port"""
+        self.assertFalse(self.manager.start_reader(queue.SimpleQueue()))
+    
+    def test_reader_queues_chunks(self):
+        """Test received chunks are queued and the thread stops on close"""
+        chunks = [b"abc", b"de"]
+        
+        def read(size):
+            if chunks:
+                return chunks.pop(0)
+            time.sleep(0.01)
+            return b""
+        
+        mock_ser = MagicMock()
+        mock_ser.in_waiting = 0
+        mock_ser.read.side_effect = read
+        self.serial_factory.return_value = mock_ser
+        
+        self.manager.open_port("COM1 - USB")
+        rx_queue = queue.SimpleQueue()
+        self.assertTrue(self.manager.start_reader(rx_queue))
+        self.assertEqual(rx_queue.get(timeout=1), b"abc")
+        self.assertEqual(rx_queue.get(timeout=1), b"de")
+        
+        reader = self.manager._reader
+        self.manager.close_port()
+        self.assertFalse(reader.is_alive())
+    
+    def test_reader_queues_decoded_items(self):
+        """Test decoded packets are queued instead of raw chunks"""
+        payload = bytes(range(0x20, 0x30))
+        chunks = [b"\r" + payload[:5], payload[5:] + b"\n"]
+        
+        def read(size):
+            if chunks:
+                return chunks.pop(0)
+            time.sleep(0.01)
+            return b""
+        
+        mock_ser = MagicMock()
+        mock_ser.in_waiting = 0
+        mock_ser.read.side_effect = read
+        self.serial_factory.return_value = mock_ser
+        
+        self.manager.open_port("COM1 - USB")
+        rx_queue = queue.SimpleQueue()
+        self.assertTrue(self.manager.start_reader(rx_queue, PacketProcessor().process_bytes))
+        self.assertEqual(rx_queue.get(timeout=1), payload)
+        self.manager.close_port()
+        self.assertTrue(rx_queue.empty())
+    
+    def test_reader_flushes_stale_input_first(self):
+        """Test the reader thread, not open_port, discards bytes queued before the open"""
+        read_started = threading.Event()
+        mock_ser = MagicMock()
+        mock_ser.in_waiting = 0
+        mock_ser.read.side_effect = lambda size: read_started.set() or time.sleep(0.005) or b""
+        self.serial_factory.return_value = mock_ser
+        self.manager.open_port("COM1 - USB")
+        mock_ser.reset_input_buffer.assert_not_called()
+        
+        self.manager.start_reader(queue.SimpleQueue())
+        self.assertTrue(read_started.wait(1))
+        self.manager.close_port()
+        mock_ser.reset_input_buffer.assert_called_once_with()
+        names = [name for name, args, kwargs in mock_ser.mock_calls]
+        self.assertLess(names.index('reset_input_buffer'), names.index('read'))
+    
+    def test_restart_rebinds_queue(self):
+        """Test starting the reader again feeds the new queue, not the old one"""
+        mock_ser = MagicMock()
+        mock_ser.in_waiting = 0
+        mock_ser.read.side_effect = lambda size: time.sleep(0.005) or b"x"
+        self.serial_factory.return_value = mock_ser
+        self.manager.open_port("COM1 - USB")
+        
+        old_queue, new_queue = queue.SimpleQueue(), queue.SimpleQueue()
+        self.manager.start_reader(old_queue)
+        old_reader = self.manager._reader
+        self.manager.start_reader(new_queue)
+        self.assertFalse(old_reader.is_alive())
+        self.assertEqual(new_queue.get(timeout=1), b"x")
+        self.manager.close_port()
+    
+    def test_reopen_closes_previous_handle(self):
+        """Test opening while a port is open releases the old handle"""
+        first, second = MagicMock(), MagicMock()
+        self.serial_factory.side_effect = [first, second]
+        self.manager.open_port("COM1 - USB")
+        self.manager.open_port("COM2 - USB")
+        first.close.assert_called_once_with()
+        self.assertIs(self.manager.ser, second)
+    
+    def test_stop_cancels_blocked_read(self):
+        """Test stopping does not wait out the read timeout"""
+        cancelled = threading.Event()
+        mock_ser = MagicMock()
+        mock_ser.in_waiting = 0
+        mock_ser.read.side_effect = lambda size: cancelled.wait(5) and b""
+        mock_ser.cancel_read.side_effect = cancelled.set
+        self.serial_factory.return_value = mock_ser
+        self.manager.open_port("COM1 - USB")
+        self.manager.start_reader(queue.SimpleQueue())
+        reader = self.manager._reader
+        
+        started = time.monotonic()
+        self.manager.stop_reader()
+        self.assertLess(time.monotonic() - started, 1)
+        mock_ser.cancel_read.assert_called_once_with()
+        self.assertFalse(reader.is_alive())
+
+
+class _DeferredThread:
+    """Thread stand-in whose target runs only when the test calls finish()"""
+    
+    def __init__(self, target, **kwargs):
+        self.target = target
+        self.alive = False
+    
+    def start(self):
+        self.alive = True
+    
+    def is_alive(self):
+        return self.alive
+    
+    def finish(self):
+        self.target()
+        self.alive = False
+
+
+class TestDashboardPortScan(unittest.TestCase):
+    """Test the background port scan without a Tk display"""
+    
+    def setUp(self):
+        self.frame = DashboardFrame.__new__(DashboardFrame)
+        self.frame.controller = MagicMock()
+        self.frame.controller.port_manager.get_available_ports.return_value = ["COM1 - USB"]
+        self.frame.combo = MagicMock()
+        self.frame.combo.get.return_value = ""
+        self.frame.after = MagicMock()
+        self.frame._port_scan = None
+        self.frame._port_results = queue.SimpleQueue()
+        self.frame._rescan_pending = False
+        self.threads = []
+        patcher = patch('wireless_sensor.threading.Thread', side_effect=self._make_thread)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def _make_thread(self, target, **kwargs):
+        thread = _DeferredThread(target, **kwargs)
+        self.threads.append(thread)
+        return thread
+    
+    def test_scan_result_fills_combo(self):
+        """Test the list is filled once the worker reports, polling until then"""
+        self.frame.update_ports()
+        self.frame.after.assert_called_once_with(DashboardFrame.PORT_POLL_MS, self.frame._poll_port_scan)
+        self.frame.combo.__setitem__.assert_not_called()
+        
+        self.threads[0].finish()
+        self.frame._poll_port_scan()
+        self.frame.combo.__setitem__.assert_called_once_with('values', ["COM1 - USB"])
+        self.frame.combo.current.assert_called_once_with(0)
+    
+    def test_refresh_during_scan_rescans(self):
+        """Test a refresh arriving mid-scan starts a fresh scan afterwards"""
+        manager = self.frame.controller.port_manager
+        self.frame.update_ports()
+        self.frame.update_ports()
+        self.assertEqual(len(self.threads), 1)
+        
+        self.threads[0].finish()
+        self.frame._poll_port_scan()
+        manager.invalidate_ports.assert_called_once_with()
+        self.assertEqual(len(self.threads), 2)
+        self.assertFalse(self.frame._rescan_pending)
+        
+        self.threads[1].finish()
+        self.frame._poll_port_scan()
+        self.assertEqual(len(self.threads), 2)
+        self.assertEqual(manager.get_available_ports.call_count, 2)
+
+
+class TestDashboardSession(unittest.TestCase):
+    """Test connect and reconnect handling without a Tk display"""
+    
+    def setUp(self):
+        self.frame = DashboardFrame.__new__(DashboardFrame)
+        self.frame.controller = controller = MagicMock()
+        controller.is_reading = False
+        manager = controller.port_manager
+        manager.is_open = False
+        
+        def open_port(port):
+            manager.is_open = True
+            return True, "opened"
+        
+        def close_port():
+            manager.is_open = False
+            return True, "closed"
+        
+        manager.open_port.side_effect = open_port
+        manager.close_port.side_effect = close_port
+        self.frame.combo = MagicMock()
+        self.frame.combo.get.return_value = "COM1 - USB"
+        self.frame.after = MagicMock(side_effect=["job1", "job2"])
+        self.frame.after_cancel = MagicMock()
+        self.frame._setters = ()
+        self.frame._open_failed = False
+        self.frame._read_job = None
+    
+    def test_connect_again_restarts_single_session(self):
+        """Test a second connect closes the first session and keeps one drain loop"""
+        manager = self.frame.controller.port_manager
+        self.frame._open_port()
+        self.assertEqual(self.frame._read_job, "job1")
+        
+        self.frame._open_port()
+        manager.close_port.assert_called_once_with()
+        self.frame.after_cancel.assert_called_once_with("job1")
+        self.assertEqual(self.frame._read_job, "job2")
+        self.assertEqual(manager.start_reader.call_count, 2)
+        self.assertIs(manager.start_reader.call_args[0][0], self.frame.controller.rx_queue)
+
+
+class TestPortHotPlug(unittest.TestCase):
+    """Test hot-plug events are handed to the Tk thread without a display"""
+    
+    def setUp(self):
+        self.gui = SensorGUI.__new__(SensorGUI)
+        self.gui.port_manager = MagicMock()
+        self.gui.frames = {"DashboardFrame": MagicMock()}
+        self.gui.after = MagicMock()
+        self.gui._port_events = queue.SimpleQueue()
+        self.gui._port_observer = MagicMock()
+    
+    def test_event_only_queued_on_monitor_thread(self):
+        """Test the monitor callback touches neither Tk nor the port cache"""
+        self.gui._on_port_event(object())
+        self.gui.after.assert_not_called()
+        self.gui.port_manager.invalidate_ports.assert_not_called()
+    
+    def test_poll_invalidates_and_refreshes_once(self):
+        """Test queued events invalidate the cache and schedule one refresh"""
+        self.gui._on_port_event(object())
+        self.gui._on_port_event(object())
+        self.gui._poll_port_events()
+        self.gui.port_manager.invalidate_ports.assert_called_once_with()
+        self.gui.frames["DashboardFrame"].update_ports.assert_called_once_with()
+        self.gui.after.assert_called_once_with(SensorGUI.PORT_EVENT_POLL_MS, self.gui._poll_port_events)
+        
+        self.gui._poll_port_events()
+        self.gui.port_manager.invalidate_ports.assert_called_once_with()
+    
+    def test_destroy_stops_observer(self):
+        """Test closing the window stops the monitor thread"""
+        observer = self.gui._port_observer
+        with patch('wireless_sensor.tk.Tk.destroy') as tk_destroy:
+            self.gui.destroy()
+        observer.stop.assert_called_once_with()
+        tk_destroy.assert_called_once_with()
+        self.assertIsNone(self.gui._port_observer)
 
 
 class TestPacketProcessor(unittest.TestCase):
@@ -230,16 +726,60 @@ class TestPacketProcessor(unittest.TestCase):
     def test_process_incomplete_packet_frame_end(self):
         """Test incomplete packet at frame end"""
         # Add some data
-        self.processor.packet = [1, 2, 3]  # Only 3 bytes instead of 18
+        for b in (1, 2, 3):  # Only 3 bytes instead of a full packet
+            self.processor.process_int(b)
         result = self.processor.process_byte(b"\n")
         self.assertIsNone(result)
     
+    def test_process_int_complete_packet(self):
+        """Test integer fast path assembles an escaped frame"""
+        payload = [0x0A] + list(range(0x20, 0x2F))
+        stream = [0x0D, 0x08] + payload + [0x0A]
+        results = [self.processor.process_int(b) for b in stream]
+        self.assertEqual(results[:-1], [None] * (len(stream) - 1))
+        self.assertEqual(list(results[-1]), payload)
+    
+    def test_process_bytes_across_chunks(self):
+        """Test chunked processing matches the per-byte state machine"""
+        payload = bytes([0x08, 0x0D] + list(range(0x20, 0x2E)))
+        frame = b"\r" + b"\x08" + payload[:1] + b"\x08" + payload[1:2] + payload[2:] + b"\n"
+        stream = b"\x01\x02\n" + frame + frame
+        
+        packets = self.processor.process_bytes(stream[:10])
+        packets += self.processor.process_bytes(stream[10:])
+        self.assertEqual(packets, [payload, payload])
+        
+        reference = PacketProcessor()
+        expected = [p for p in map(reference.process_int, stream) if p]
+        self.assertEqual(packets, expected)
+    
+    def test_process_bytes_unescaped_fast_path(self):
+        """Test chunks without escape bytes match the per-byte state machine"""
+        payload = bytes(range(0x20, 0x30))
+        stream = b"\x01\n" + b"\r" + payload + b"\n" + b"\r" + payload[:3] + b"\r" + payload + b"\n" + b"\r" + payload + b"\x30\n"
+        
+        packets = []
+        for i in range(0, len(stream), 7):
+            packets += self.processor.process_bytes(stream[i:i + 7])
+        self.assertEqual(packets, [payload, payload])
+        
+        reference = PacketProcessor()
+        expected = [p for p in map(reference.process_int, stream) if p]
+        self.assertEqual(packets, expected)
+    
+    def test_process_oversized_packet(self):
+        """Test frames longer than a packet are rejected"""
+        stream = b"\r" + bytes(range(0x20, 0x31)) + b"\n"
+        self.assertEqual(self.processor.process_bytes(stream), [])
+        self.assertIsNone([self.processor.process_int(b) for b in stream][-1])
+    
     def test_reset_processor(self):
         """Test processor reset"""
-        self.processor.packet = [1, 2, 3]
+        for b in (1, 2, 3):
+            self.processor.process_int(b)
         self.processor.escape = True
         self.processor.reset()
-        self.assertEqual(self.processor.packet, [])
+        self.assertEqual(self.processor.packet, b"")
         self.assertFalse(self.processor.escape)
 
 
@@ -317,6 +857,42 @@ class TestSensorDataParser(unittest.TestCase):
         packet[4] = 0xFF
         result = self.parser.parse_packet(packet)
         self.assertIsNotNone(result)
+    
+    def test_parse_rtd_raw_lookup(self):
+        """Test raw RTD readings convert like the resistance table"""
+        packet = bytearray(16)
+        packet[14:16] = (3700).to_bytes(2, 'little')
+        for raw in (0x0000, 0x2000, 0x2E5B, 0x7FFF, 0xFFFF):
+            packet[10:12] = raw.to_bytes(2, 'little')
+            result = self.parser.parse_packet(bytes(packet))
+            expected = RTDTemperatureTable.get_temperature_from_resistance(raw * 400 / 2**15)
+            self.assertEqual(result.rtd_temperature, expected)
+    
+    def test_parse_battery_range_checked_inline(self):
+        """Test the parser rejects an out-of-range battery without revalidating"""
+        packet = bytearray(16)
+        packet[14:16] = (10000).to_bytes(2, 'little')
+        self.assertTrue(self.parser.parse_packet(bytes(packet)).is_valid())
+        packet[14:16] = (10001).to_bytes(2, 'little')
+        with patch.object(SensorData, 'is_valid') as is_valid:
+            with self.assertRaises(ValueError):
+                self.parser.parse_packet(bytes(packet))
+        is_valid.assert_not_called()
+    
+    def test_parse_packets_burst(self):
+        """Test bulk parsing matches single parsing and skips bad frames"""
+        good = bytearray(16)
+        good[0:4] = (253000).to_bytes(4, 'little')
+        good[10:12] = (0x2000).to_bytes(2, 'little')
+        good[14:16] = (3700).to_bytes(2, 'little')
+        bad = bytearray(good)
+        bad[14:16] = (0xFFFF).to_bytes(2, 'little')
+        packets = [bytes(good), bytes(bad), bytes(good)]
+        
+        readings = self.parser.parse_packets(packets)
+        self.assertEqual(readings, [self.parser.parse_packet(bytes(good))] * 2)
+        self.assertEqual(readings[0].temperature, 25.3)
+        self.assertEqual(self.parser.parse_packets([bytes(good), b"short"]), readings[:1])
 
 
 class TestSensorErrorTypes(unittest.TestCase):
@@ -342,12 +918,12 @@ class TestEdgeCases(unittest.TestCase):
     def test_rtd_maximum_value(self):
         """Test RTD with maximum table value"""
         temp = RTDTemperatureTable.get_temperature_from_resistance(390.2623)
-        self.assertIsInstance(temp, int)
+        self.assertIsInstance(temp, float)
     
     def test_rtd_between_values(self):
         """Test RTD with value between table entries"""
         temp = RTDTemperatureTable.get_temperature_from_resistance(100.5)
-        self.assertIsInstance(temp, int)
+        self.assertIsInstance(temp, float)
     
     def test_battery_voltage_at_minimum(self):
         """Test minimum valid battery voltage"""
@@ -358,7 +934,7 @@ class TestEdgeCases(unittest.TestCase):
             rtd_temperature=50,
             thermocouple=15.5,
             battery_voltage=0.0,
-            raw_packet=list(range(18))
+            raw_packet=_RAW16
         )
         self.assertTrue(data.is_valid())
     
@@ -371,7 +947,7 @@ class TestEdgeCases(unittest.TestCase):
             rtd_temperature=50,
             thermocouple=15.5,
             battery_voltage=10.0,
-            raw_packet=list(range(18))
+            raw_packet=_RAW16
         )
         self.assertTrue(data.is_valid())
 
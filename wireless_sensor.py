@@ -8,12 +8,27 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import serial
 import serial.tools.list_ports
-from typing import List, Optional, Tuple
+from typing import Callable, Iterable, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 import logging
+import math
+import os
+import queue
+import re
 import struct
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
 from datetime import datetime
+from functools import partial
+
+try:
+    import pyudev  # Optional: refreshes the port list on hot-plug events on Linux
+except ImportError:
+    pyudev = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -31,146 +46,226 @@ class SensorErrorType(Enum):
     DEVICE_NOT_CONNECTED = "Device not connected"
 
 
-@dataclass
+# Messages resolved once for raise sites on the packet path
+_INVALID_PACKET_LENGTH_MSG = SensorErrorType.INVALID_PACKET_LENGTH.value
+
+# Exact numeric types accepted for sensor values (bool and str are rejected)
+_NUMERIC = (int, float)
+
+
+@dataclass(frozen=True, slots=True)
 class SensorData:
     """Data class for sensor readings"""
     temperature: float
     device_id: str
     rtd_resistance: float
-    rtd_temperature: int
+    rtd_temperature: float
     thermocouple: float
     battery_voltage: float
     rssi: int
-    raw_packet: List[int]
+    raw_packet: bytes
 
     def is_valid(self) -> bool:
-        """Validate sensor data"""
+        """Validate sensor data; field types are checked only outside optimized (-O) runs"""
         try:
-            if not isinstance(self.temperature, (int, float)):
-                return False
-            if not isinstance(self.battery_voltage, (int, float)):
+            if not (0 <= self.battery_voltage <= 10 and len(self.raw_packet) == 16):
                 return False
-            if self.battery_voltage < 0 or self.battery_voltage > 10:
-                return False
-            if not isinstance(self.device_id, str):
-                return False
-            if len(self.raw_packet) != 16:
-                return False
-            return True
         except (TypeError, AttributeError):
             return False
+        if __debug__:
+            return (type(self.temperature) in _NUMERIC
+                    and type(self.battery_voltage) in _NUMERIC
+                    and isinstance(self.device_id, str))
+        return True
+
+
+class SensorFrameBuffer:
+    """Fixed-capacity ring buffer of sensor readings stored column-wise"""
+    
+    NUMERIC_FIELDS = (
+        ('temperature', 'd'),
+        ('rtd_resistance', 'd'),
+        ('rtd_temperature', 'd'),
+        ('thermocouple', 'd'),
+        ('rssi', 'H'),
+    )
+    BATTERY_MV_MAX = 10000
+    
+    def __init__(self, capacity: int = 1024):
+        if capacity <= 0:
+            raise ValueError("Buffer capacity must be positive")
+        self.capacity = capacity
+        self.columns = {name: array(code, [0]) * capacity for name, code in self.NUMERIC_FIELDS}
+        # Battery is kept as 16-bit millivolts clamped to 0..65535; battery_valid records the
+        # 0..10 V range check made before clamping and is the source of truth for validity
+        self.columns['battery_voltage_mv'] = array('H', [0]) * capacity
+        self.battery_valid = array('B', [0]) * capacity
+        self.device_ids: List[str] = [""] * capacity
+        self.count = 0
+        self._next = 0
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def append(self, data: SensorData):
+        """Store a reading, overwriting the oldest one when full"""
+        i = self._next
+        for name, _ in self.NUMERIC_FIELDS:
+            self.columns[name][i] = getattr(data, name)
+        voltage = data.battery_voltage
+        mv = round(voltage * 1000) if math.isfinite(voltage) else 0
+        self.columns['battery_voltage_mv'][i] = min(max(mv, 0), 0xFFFF)
+        self.battery_valid[i] = 0 <= voltage <= self.BATTERY_MV_MAX / 1000
+        self.device_ids[i] = data.device_id
+        self._next = (i + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+    
+    def column(self, name: str) -> List:
+        """Return a field's values in arrival order, oldest first"""
+        if name == 'battery_voltage':
+            return [mv / 1000.0 for mv in self.column('battery_voltage_mv')]
+        if name == 'device_id':
+            values = self.device_ids
+        elif name == 'battery_valid':
+            values = self.battery_valid
+        else:
+            values = self.columns[name]
+        if self.count < self.capacity:
+            return list(values[:self.count])
+        return list(values[self._next:]) + list(values[:self._next])
+    
+    def valid_mask(self) -> List[bool]:
+        """Return per-reading battery range validity, oldest first"""
+        return [bool(ok) for ok in self.column('battery_valid')]
+    
+    def clear(self):
+        """Drop all stored readings"""
+        self.count = 0
+        self._next = 0
+
+
+def _build_sorted_table(values: array, offset: int) -> Tuple[array, array]:
+    """Build sorted parallel (value, temperature) arrays from a 1 degree step table
+
+    Tables need not be strictly monotonic, so repeated values keep the
+    lowest temperature.
+    """
+    lookup = {}
+    for index, value in enumerate(values):
+        lookup.setdefault(value, index + offset)
+    keys = sorted(lookup)
+    return array('d', keys), array('h', (lookup[k] for k in keys))
+
+
+def _nearest_lookup(values: array, temperatures: array, x: float) -> int:
+    """Return the temperature of the entry in sorted values nearest to x
+
+    Exact ties go to the lower temperature, matching a first-match scan of the
+    source table.
+    """
+    index = bisect_left(values, x)
+    if index == len(values):
+        index -= 1
+    elif index > 0:
+        below = x - values[index - 1]
+        above = values[index] - x
+        if below < above or (below == above and temperatures[index - 1] < temperatures[index]):
+            index -= 1
+    return temperatures[index]
+
+
+def _interp_lookup(values: array, temperatures: array, x: float) -> float:
+    """Linearly interpolate the temperature at x between the bracketing sorted entries"""
+    index = bisect_left(values, x)
+    if index == 0:
+        return float(temperatures[0])
+    if index == len(values):
+        return float(temperatures[-1])
+    r0 = values[index - 1]
+    t0 = temperatures[index - 1]
+    return t0 + (temperatures[index] - t0) * (x - r0) / (values[index] - r0)
+
+
+# Callendar-Van Dusen coefficients for a Pt100 element (IEC 60751), valid for -200..850 degC
+_CVD_R0 = 100.0
+_CVD_A = 3.9083e-3
+_CVD_B = -5.775e-7
+_CVD_C = -4.183e-12
+_CVD_T_MIN = -200
+_CVD_T_MAX = 850
+_CVD_R_MAX = _CVD_R0 * (1 + _CVD_A * _CVD_T_MAX + _CVD_B * _CVD_T_MAX ** 2)
+
+
+def _cvd_resistance(temperature: int) -> float:
+    """Pt100 resistance at a temperature; the C term only applies below 0 degC"""
+    t = temperature
+    ratio = 1 + _CVD_A * t + _CVD_B * t * t
+    if t < 0:
+        ratio += _CVD_C * (t - 100) * t * t * t
+    return _CVD_R0 * ratio
+
+
+def _cvd_temperature(rtd_resistance: float) -> float:
+    """Invert R = R0 * (1 + A*T + B*T^2) for resistances at or above R0"""
+    if rtd_resistance >= _CVD_R_MAX:
+        return float(_CVD_T_MAX)
+    disc = _CVD_A * _CVD_A - 4.0 * _CVD_B * (1.0 - rtd_resistance / _CVD_R0)
+    return (-_CVD_A + math.sqrt(disc)) / (2.0 * _CVD_B)
 
 
 class RTDTemperatureTable:
     """RTD resistance to temperature conversion table"""
     
-    rtd_values = [18.4932, 18.9258, 19.3580, 19.7899, 20.2215, 20.6526, 21.0834, 21.5139, 21.9439, 22.3737, 22.8031,
-                  23.2321, 23.6608, 24.0891, 24.5171, 24.9447, 25.3720, 25.7990, 26.2257, 26.6520, 27.0779, 27.5036,
-                  27.9289, 28.3539, 28.7786, 29.2029, 29.6270, 30.0507, 30.4741, 30.8972, 31.3200, 31.7425, 32.1646,
-                  32.5865, 33.0081, 33.4294, 33.8503, 34.2710, 34.6914, 35.1115, 35.5313, 35.9508, 36.3700, 36.7889,
-                  37.2076, 37.6260, 38.0440, 38.4619, 38.8794, 39.2967, 39.7137, 40.1304, 40.5469, 40.9631, 41.3790,
-                  41.7946, 42.2101, 42.6252, 43.0401, 43.4547, 43.8691, 44.2832, 44.6971, 45.1107, 45.5241, 45.9372,
-                  46.3501, 46.7628, 47.1752, 47.5873, 47.9993, 48.4109, 48.8224, 49.2336, 49.6446, 50.0554, 50.4659,
-                  50.8762, 51.2863, 51.6962, 52.1058, 52.5152, 52.9244, 53.3334, 53.7422, 54.1507, 54.5591, 54.9672,
-                  55.3751, 55.7828, 56.1903, 56.5976, 57.0047, 57.4115, 57.8182, 58.2247, 58.6310, 59.0371, 59.4429,
-                  59.8486, 60.2541, 60.6594, 61.0645, 61.4695, 61.8742, 62.2787, 62.6831, 63.0873, 63.4912, 63.8950,
-                  64.2987, 64.7021, 65.1054, 65.5084, 65.9114, 66.3141, 66.7166, 67.1190, 67.5212, 67.9233, 68.3251,
-                  68.7268, 69.1284, 69.5297, 69.9309, 70.3319, 70.7328, 71.1335, 71.5340, 71.9344, 72.3346, 72.7347,
-                  73.1346, 73.5343, 73.9339, 74.3334, 74.7326, 75.1318, 75.5307, 75.9296, 76.3282, 76.7268, 77.1251,
-                  77.5234, 77.9214, 78.3194, 78.7171, 79.1148, 79.5123, 79.9096, 80.3068, 80.7039, 81.1008, 81.4976,
-                  81.8943, 82.2908, 82.6871, 83.0834, 83.4795, 83.8754, 84.2713, 84.6669, 85.0625, 85.4579, 85.8532,
-                  86.2484, 86.6434, 87.0383, 87.4331, 87.8277, 88.2222, 88.6166, 89.0109, 89.4050, 89.7990, 90.1929,
-                  90.5866, 90.9802, 91.3737, 91.7671, 92.1603, 92.5535, 92.9465, 93.3394, 93.7321, 94.1247, 94.5173,
-                  94.9097, 95.3019, 95.6941, 96.0861, 96.4780, 96.8698, 97.2615, 97.6531, 98.0445, 98.4359, 98.8271,
-                  99.2182, 99.6091, 100.0000, 100.3907, 100.7814, 101.1719, 101.5623, 101.9526, 102.3427, 102.7328,
-                  103.1227, 103.5125, 103.9022, 104.2918, 104.6813, 105.0706, 105.4599, 105.8490, 106.2380, 106.6269,
-                  107.0156, 107.4043, 107.7928, 108.1813, 108.5696, 108.9578, 109.3458, 109.7338, 110.1216, 110.5094,
-                  110.8970, 111.2845, 111.6718, 112.0591, 112.4463, 112.8333, 113.2202, 113.6070, 113.9937, 114.3802,
-                  114.7667, 115.1530, 115.5392, 115.9254, 116.3113, 116.6972, 117.0830, 117.4686, 117.8541, 118.2395,
-                  118.6248, 119.0100, 119.3951, 119.7800, 120.1648, 120.5495, 120.9341, 121.3186, 121.7030, 122.0872,
-                  122.4713, 122.8554, 123.2392, 123.6230, 124.0067, 124.3902, 124.7737, 125.1570, 125.5402, 125.9233,
-                  126.3063, 126.6891, 127.0718, 127.4545, 127.8370, 128.2194, 128.6016, 128.9838, 129.3658, 129.7478,
-                  130.1296, 130.5113, 130.8928, 131.2743, 131.6556, 132.0369, 132.4180, 132.7990, 133.1799, 133.5606,
-                  133.9413, 134.3218, 134.7022, 135.0825, 135.4627, 135.8428, 136.2227, 136.6026, 136.9823, 137.3619,
-                  137.7414, 138.1207, 138.5000, 138.8791, 139.2582, 139.6371, 140.0159, 140.3945, 140.7731, 141.1515,
-                  141.5299, 141.9081, 142.2862, 142.6642, 143.0420, 143.4198, 143.7974, 144.1749, 144.5523, 144.9296,
-                  145.3068, 145.6838, 146.0608, 146.4376, 146.8143, 147.1909, 147.5673, 147.9437, 148.3199, 148.6960,
-                  149.0721, 149.4479, 149.8237, 150.1994, 150.5749, 150.9504, 151.3257, 151.7009, 152.0759, 152.4509,
-                  152.8257, 153.2005, 153.5751, 153.9496, 154.3240, 154.6982, 155.0724, 155.4464, 155.8203, 156.1941,
-                  156.5678, 156.9414, 157.3149, 157.6882, 158.0614, 158.4345, 158.8075, 159.1804, 159.5531, 159.9258,
-                  160.2983, 160.6707, 161.0430, 161.4152, 161.7872, 162.1592, 162.5310, 162.9027, 163.2743, 163.6458,
-                  164.0172, 164.3884, 164.7596, 165.1306, 165.5015, 165.8723, 166.2429, 166.6135, 166.9839, 167.3542,
-                  167.7245, 168.0945, 168.4645, 168.8344, 169.2041, 169.5737, 169.9432, 170.3126, 170.6819, 171.0511,
-                  171.4201, 171.7890, 172.1579, 172.5266, 172.8951, 173.2636, 173.6319, 174.0002, 174.3683, 174.7363,
-                  175.1042, 175.4719, 175.8396, 176.2071, 176.5746, 176.9419, 177.3090, 177.6761, 178.0431, 178.4099,
-                  178.7766, 179.1432, 179.5097, 179.8761, 180.2424, 180.6085, 180.9745, 181.3405, 181.7063, 182.0719,
-                  182.4375, 182.8029, 183.1683, 183.5335, 183.8986, 184.2636, 184.6284, 184.9932, 185.3578, 185.7223,
-                  186.0867, 186.4510, 186.8152, 187.1793, 187.5432, 187.9070, 188.2707, 188.6343, 188.9978, 189.3611,
-                  189.7244, 190.0875, 190.4505, 190.8134, 191.1762, 191.5389, 191.9014, 192.2638, 192.6262, 192.9884,
-                  193.3504, 193.7124, 197.3257, 196.9649, 196.6040, 196.2429, 195.8818, 195.5205, 195.1591, 194.7976,
-                  194.4360, 194.0743, 197.3257, 196.9649, 196.6040, 196.2429, 195.8818, 195.5205, 195.1591, 194.7976,
-                  194.4360, 194.0743, 194.0743, 194.4360, 194.7976, 195.1591, 195.5205, 195.8818, 196.2429, 196.6040,
-                  196.9649, 197.3257, 197.6864, 198.0469, 198.4074, 198.7677, 199.1280, 199.4881, 199.8481, 200.2079,
-                  200.5677, 200.9274, 201.2869, 201.6463, 202.0056, 202.3648, 202.7238, 203.0828, 203.4416, 203.8003,
-                  204.1589, 204.5174, 204.8758, 205.2340, 205.5922, 205.9502, 206.3081, 206.6659, 207.0236, 207.3811,
-                  207.7386, 208.0959, 208.4531, 208.8102, 209.1672, 209.5240, 209.8808, 210.2374, 210.5939, 210.9503,
-                  211.3066, 211.6628, 212.0188, 212.3747, 212.7305, 213.0862, 213.4418, 213.7973, 214.1527, 214.5079,
-                  214.8630, 215.2180, 215.5729, 215.9277, 216.2823, 216.6369, 216.9913, 217.3456, 217.6998, 218.0539,
-                  218.4078, 218.7617, 219.1154, 219.4690, 219.8225, 220.1759, 220.5291, 220.8823, 221.2353, 221.5882,
-                  221.9410, 222.2937, 222.6463, 222.9987, 223.3511, 223.7033, 224.0554, 224.4074, 224.7592, 225.1110,
-                  225.4626, 225.8142, 226.1656, 226.5169, 226.8680, 227.2191, 227.5700, 227.9209, 228.2716, 228.6222,
-                  228.9726, 229.3230, 229.6733, 229.6733, 230.3734, 230.7233, 231.0731, 231.4227, 231.7723, 232.1217,
-                  232.4710, 232.8202, 233.1693, 233.5183, 233.8672, 234.2159, 234.5645, 234.9130, 235.2614, 235.6097,
-                  235.9578, 236.3059, 236.6538, 237.0016, 237.3493, 237.6969, 238.0443, 238.3917, 238.7389, 239.0860,
-                  239.4330, 239.7799, 240.1267, 240.4733, 240.8199, 241.1663, 241.5126, 241.8588, 242.2048, 242.5508,
-                  242.8966, 243.2423, 243.5879, 243.9334, 244.2788, 244.6241, 244.9692, 245.3142, 245.6591, 246.0039,
-                  246.3486, 246.6932, 247.0376, 247.3819, 247.7261, 248.0702, 248.4142, 248.7581, 249.1018, 249.4455,
-                  249.7890, 250.1324, 250.4757, 250.8188, 251.1619, 251.5048, 251.8476, 252.1903, 252.5329, 252.8754,
-                  253.2177, 253.5600, 253.9021, 254.2441, 254.5860, 254.9278, 255.2694, 255.6110, 255.9524, 256.2937,
-                  256.6349, 256.9760, 257.3170, 257.6578, 257.9985, 258.3392, 258.6797, 259.0200, 259.3603, 259.7005,
-                  260.0405, 260.3804, 260.7202, 261.0599, 261.3995, 261.7389, 262.0783, 262.4175, 262.7566, 263.0956,
-                  263.4344, 263.7732, 264.1119, 264.4504, 264.7888, 265.1271, 265.4653, 265.8033, 266.1413, 266.4791,
-                  266.8168, 267.1544, 267.4919, 267.8293, 268.1665, 268.5036, 268.8407, 269.1776, 269.5143, 269.8510,
-                  270.1876, 270.5240, 270.8603, 271.1965, 271.5326, 271.8686, 272.2044, 272.5402, 272.8758, 273.2113,
-                  273.5467, 273.8820, 274.2172, 274.5522, 274.8871, 275.2219, 275.5566, 275.8912, 276.2257, 276.5600,
-                  276.8943, 277.2284, 277.5624, 277.8963, 278.2300, 278.5637, 278.8972, 279.2306, 279.5639, 279.8971,
-                  280.2302, 280.5632, 280.8960, 281.2287, 281.5613, 281.8938, 282.2262, 282.5585, 282.8906, 283.2226,
-                  283.5545, 283.8863, 284.2180, 284.5496, 284.8810, 285.2124, 285.5436, 285.8747, 286.2057, 286.5365,
-                  286.8673, 287.1979, 287.5284, 287.8588, 288.1891, 288.5193, 288.8493, 289.1793, 289.5091, 289.8388,
-                  290.1684, 290.4979, 293.7862, 293.4579, 293.1295, 292.8010, 292.4723, 292.1435, 291.8146, 291.4856,
-                  291.1565, 290.8272, 290.8272, 291.1565, 291.4856, 291.8146, 292.1435, 292.4723, 292.8010, 293.1295,
-                  293.4579, 293.7862]
+    # Resistance at each whole degree from -200 to 850 degC, index - 200 = temperature
+    rtd_values = array('d', (round(_cvd_resistance(t), 4) for t in range(_CVD_T_MIN, _CVD_T_MAX + 1)))
+
+    # Sorted resistance / temperature arrays used for binary search lookups
+    _R, _T = _build_sorted_table(rtd_values, -200)
 
     @classmethod
-    def get_temperature_from_resistance(cls, rtd_resistance: float) -> int:
+    def get_temperature_from_resistance(cls, rtd_resistance: float) -> float:
         """Convert RTD resistance value to temperature"""
-        if not isinstance(rtd_resistance, (int, float)):
-            logger.error(f"Invalid RTD resistance type: {type(rtd_resistance)}")
+        if type(rtd_resistance) not in _NUMERIC:
+            logger.error("Invalid RTD resistance type: %s", type(rtd_resistance))
             raise ValueError("RTD resistance must be a number")
         
         if rtd_resistance < 0:
-            logger.error(f"Negative RTD resistance: {rtd_resistance}")
+            logger.error("Negative RTD resistance: %s", rtd_resistance)
             raise ValueError("RTD resistance cannot be negative")
         
-        if not cls.rtd_values:
+        if not cls._R:
             logger.error("RTD values table is empty")
             raise ValueError("RTD values table not initialized")
         
         try:
-            index = min(range(len(cls.rtd_values)), 
-                       key=lambda i: abs(cls.rtd_values[i] - rtd_resistance))
-            nearest_temp = index - 200
-            logger.info(f"RTD resistance {rtd_resistance} -> temperature {nearest_temp}")
-            return nearest_temp
+            return _rtd_temperature(rtd_resistance)
         except Exception as e:
-            logger.error(f"Error converting RTD resistance to temperature: {e}")
+            logger.error("Error converting RTD resistance to temperature: %s", e)
             raise ValueError(f"Failed to convert RTD resistance: {e}")
 
 
+# RTD kernel bound once to the class lookup arrays: resistance -> temperature
+_rtd_lookup = partial(_interp_lookup, RTDTemperatureTable._R, RTDTemperatureTable._T)
+
+
+def _rtd_temperature(rtd_resistance: float) -> float:
+    """Convert an already validated, non-negative RTD resistance to temperature"""
+    # Closed form above 0 degC; the C term has no closed inverse, so use the table below
+    if rtd_resistance >= _CVD_R0:
+        return _cvd_temperature(rtd_resistance)
+    return _rtd_lookup(rtd_resistance)
+
+
+# Packets carry RTD resistance as raw * 400 / 2^15, so every reading in that range
+# is converted once at import and parsing becomes a single index
+_RTD_RAW_LIMIT = 2**15
+_RTD_RAW_LUT = array('d', (_rtd_temperature((raw * 400) / _RTD_RAW_LIMIT) for raw in range(_RTD_RAW_LIMIT)))
+
+
 class ThermocoupleTable:
     """Thermocouple voltage to temperature conversion table (Type K)"""
     
-    thermocouple_values = [0.000, 0.000, 0.000, -0.001, -0.001, -0.001, -0.001, -0.001, -0.002, -0.002, -0.002,
+    thermocouple_values = array('d', [0.000, 0.000, 0.000, -0.001, -0.001, -0.001, -0.001, -0.001, -0.002, -0.002, -0.002,
                            -0.002, -0.002, -0.002, -0.002, -0.002, -0.002, -0.002, -0.002, -0.003, -0.003, -0.003,
                            -0.003, -0.003, -0.003, -0.003, -0.003, -0.002, -0.002, -0.002, -0.002, -0.002, -0.002,
                            -0.002, -0.002, -0.002, -0.002, -0.002, -0.001, -0.001, -0.001, -0.001, -0.001, 0.000,
@@ -352,13 +447,16 @@ class ThermocoupleTable:
                             13.476, 13.488, 13.499, 13.511, 13.522, 13.534, 13.545, 13.557, 13.568, 13.580, 13.591,
                             13.591, 13.603, 13.614, 13.626, 13.637, 13.649, 13.660, 13.672, 13.683, 13.694, 13.706,
                             13.706, 13.717, 13.729, 13.740, 13.752, 13.763, 13.775, 13.786, 13.797, 13.809, 13.820 
-             ]                  
+             ])                  
+    
+    # Sorted voltage / temperature arrays used for binary search lookups
+    _V, _T = _build_sorted_table(thermocouple_values, -50)
     
     @classmethod
     def get_temperature_from_voltage(cls, voltage: float) -> float:
         """Convert thermocouple voltage to temperature"""
-        if not isinstance(voltage, (int, float)):
-            logger.error(f"Invalid thermocouple voltage type: {type(voltage)}")
+        if type(voltage) not in _NUMERIC:
+            logger.error("Invalid thermocouple voltage type: %s", type(voltage))
             raise ValueError("Thermocouple voltage must be a number")
         
         if not cls.thermocouple_values:
@@ -366,36 +464,72 @@ class ThermocoupleTable:
             raise ValueError("Thermocouple values table not initialized")
         
         try:
-            index = min(range(len(cls.thermocouple_values)), 
-                       key=lambda i: abs(cls.thermocouple_values[i] - voltage))
-            temperature = index - 50
-            logger.info(f"Thermocouple voltage {voltage} -> temperature {temperature}")
-            return temperature
+            return _nearest_lookup(cls._V, cls._T, voltage)
         except Exception as e:
-            logger.error(f"Error converting thermocouple voltage to temperature: {e}")
+            logger.error("Error converting thermocouple voltage to temperature: %s", e)
             raise ValueError(f"Failed to convert thermocouple voltage: {e}")
 
 
 class SerialPortManager:
     """Manages serial port operations"""
     
-    def __init__(self):
+    # Device name is everything before the first " - " description separator
+    _PORT_RE = re.compile(r"\s*(.*?)\s*(?: - |$)")
+    
+    # Seconds a port scan is reused, so repeated Refresh clicks do not re-enumerate
+    PORTS_CACHE_TTL = 0.5
+    
+    # FTDI-style adapters expose their receive latency timer (ms) here on Linux
+    _LATENCY_TIMER_PATH = "/sys/bus/usb-serial/devices/{}/latency_timer"
+    
+    # Seconds to let bytes queued before the open arrive so they can be discarded
+    OPEN_SETTLE_S = 0.05
+    
+    # Longest the caller waits for a cancelled reader thread to exit
+    READER_STOP_S = 0.2
+    
+    def __init__(self, serial_factory: Optional[Callable[..., serial.Serial]] = None):
+        self.serial_factory = serial_factory
         self.ser: Optional[serial.Serial] = None
         self.is_open = False
+        self._reader: Optional[threading.Thread] = None
+        self._reader_stop: Optional[threading.Event] = None
+        # Scans may run on a worker thread; the generation lets invalidate_ports
+        # discard a scan that was already in flight
+        self._ports_lock = threading.Lock()
+        self._ports_cache: List[str] = []
+        self._ports_time = 0.0
+        self._ports_generation = 0
     
     def get_available_ports(self) -> List[str]:
         """Get list of available serial ports"""
+        now = time.monotonic()
+        with self._ports_lock:
+            if self._ports_cache and now - self._ports_time < self.PORTS_CACHE_TTL:
+                return list(self._ports_cache)
+            generation = self._ports_generation
+        
         try:
             ports = [f"{p.device} - {p.description}" for p in serial.tools.list_ports.comports()]
+            with self._ports_lock:
+                if generation == self._ports_generation:
+                    self._ports_cache = ports
+                    self._ports_time = now
             if not ports:
                 logger.warning("No serial ports available")
                 return []
-            logger.info(f"Found {len(ports)} available ports")
-            return ports
+            logger.info("Found %s available ports", len(ports))
+            return list(ports)
         except Exception as e:
-            logger.error(f"Error getting available ports: {e}")
+            logger.error("Error getting available ports: %s", e)
             return []
     
+    def invalidate_ports(self):
+        """Drop the cached port scan so the next listing re-enumerates"""
+        with self._ports_lock:
+            self._ports_cache = []
+            self._ports_generation += 1
+    
     def open_port(self, port_str: str, baudrate: int = 115200) -> Tuple[bool, str]:
         """Open serial port"""
         if not port_str:
@@ -404,16 +538,22 @@ class SerialPortManager:
             return False, error_msg
         
         try:
-            parts = port_str.split(" - ")
-            port = parts[0].strip() if parts else None
+            match = self._PORT_RE.match(port_str)
+            port = match.group(1) if match else None
             
             if not port:
                 error_msg = "Invalid port format"
                 logger.error(error_msg)
                 return False, error_msg
             
-            self.ser = serial.Serial(port, baudrate, timeout=1)
+            if self.ser is not None:
+                # Reconnecting: release the previous handle and its reader first
+                self.reset()
+            
+            factory = serial.Serial if self.serial_factory is None else self.serial_factory
+            self.ser = factory(port, baudrate, timeout=1)
             self.is_open = True
+            self._set_low_latency(port)
             success_msg = f"Successfully opened {port}"
             logger.info(success_msg)
             return True, success_msg
@@ -427,12 +567,44 @@ class SerialPortManager:
             logger.error(error_msg)
             return False, error_msg
     
+    def _set_low_latency(self, port: str):
+        """Best-effort shortening of the USB-serial receive latency; never fails the open"""
+        set_mode = getattr(self.ser, 'set_low_latency_mode', None)
+        if set_mode is not None:
+            try:
+                set_mode(True)
+            except (OSError, ValueError) as e:
+                logger.warning("Could not enable low latency mode on %s: %s", port, e)
+        
+        if sys.platform.startswith('linux'):
+            try:
+                with open(self._LATENCY_TIMER_PATH.format(os.path.basename(port)), 'w') as f:
+                    f.write('1')
+            except FileNotFoundError:
+                pass  # Not a usb-serial adapter with a latency timer
+            except OSError as e:
+                logger.warning("Could not set latency timer on %s: %s", port, e)
+    
+    def _flush_input(self, ser: serial.Serial, stop: threading.Event):
+        """Drop stale bytes received before the open so framing starts clean; reader thread only"""
+        if stop.wait(self.OPEN_SETTLE_S):
+            return
+        try:
+            ser.reset_input_buffer()
+        except (OSError, serial.SerialException) as e:
+            logger.warning("Could not flush input: %s", e)
+    
     def close_port(self) -> Tuple[bool, str]:
         """Close serial port"""
+        self.stop_reader()
+        # The device may have been unplugged; rescan on the next refresh
+        self.invalidate_ports()
         try:
-            if self.ser and self.is_open:
-                self.ser.close()
+            # A failed read already cleared is_open, but the handle must still be released
+            if self.ser is not None:
+                ser, self.ser = self.ser, None
                 self.is_open = False
+                ser.close()
                 success_msg = "Port closed successfully"
                 logger.info(success_msg)
                 return True, success_msg
@@ -445,6 +617,18 @@ class SerialPortManager:
             logger.error(error_msg)
             return False, error_msg
     
+    def reset(self):
+        """Return to the initial closed state, releasing any open port"""
+        self.stop_reader()
+        if self.ser is not None:
+            try:
+                self.ser.close()
+            except Exception as e:
+                logger.warning("Error closing port during reset: %s", e)
+        self.ser = None
+        self.invalidate_ports()
+        self.is_open = False
+    
     def read_byte(self) -> Optional[bytes]:
         """Read single byte from serial port"""
         try:
@@ -453,12 +637,86 @@ class SerialPortManager:
                 return data if data else None
             return None
         except serial.SerialException as e:
-            logger.error(f"Serial read error: {e}")
+            logger.error("Serial read error: %s", e)
             self.is_open = False
             return None
         except Exception as e:
-            logger.error(f"Unexpected error reading data: {e}")
+            logger.error("Unexpected error reading data: %s", e)
             return None
+    
+    def read_available(self) -> bytes:
+        """Read all bytes waiting on the serial port, blocking for at least one"""
+        if not (self.ser and self.is_open):
+            return b""
+        return self._read_burst(self.ser)
+    
+    def _read_burst(self, ser: serial.Serial) -> bytes:
+        """Read everything waiting on ser; failures only close the port if ser is still current"""
+        try:
+            waiting = ser.in_waiting
+            if waiting:
+                return ser.read(waiting)
+            # Block for the first byte, then take whatever arrived behind it
+            data = ser.read(1)
+            waiting = ser.in_waiting
+            return data + ser.read(waiting) if data and waiting else data
+        except serial.SerialException as e:
+            if ser is self.ser:
+                logger.error("Serial read error: %s", e)
+                self.is_open = False
+            return b""
+        except Exception as e:
+            if ser is self.ser:
+                logger.error("Unexpected error reading data: %s", e)
+            return b""
+    
+    def start_reader(self, rx_queue: queue.SimpleQueue,
+                     decode: Optional[Callable[[bytes], Iterable]] = None) -> bool:
+        """Start a background thread that pushes received data onto rx_queue
+
+        Raw byte chunks are queued as read unless decode is given, in which case
+        each item decode returns for a chunk is queued instead.
+        """
+        if not (self.ser and self.is_open):
+            logger.warning("Cannot start reader: port is not open")
+            return False
+        # A running reader may be feeding an older queue; replace it rather than reuse it
+        self.stop_reader()
+        self._reader_stop = threading.Event()
+        self._reader = threading.Thread(target=self._reader_loop,
+                                        args=(self.ser, self._reader_stop, rx_queue, decode), daemon=True)
+        self._reader.start()
+        return True
+    
+    def stop_reader(self, timeout: Optional[float] = None):
+        """Stop the background reader thread, cancelling a blocked read so the caller is not held up"""
+        reader, self._reader = self._reader, None
+        stop, self._reader_stop = self._reader_stop, None
+        if stop is not None:
+            stop.set()
+        if not (reader and reader.is_alive()) or reader is threading.current_thread():
+            return
+        cancel_read = getattr(self.ser, 'cancel_read', None)
+        if cancel_read is not None:
+            try:
+                cancel_read()
+            except (OSError, serial.SerialException) as e:
+                logger.warning("Could not cancel pending read: %s", e)
+        reader.join(self.READER_STOP_S if timeout is None else timeout)
+    
+    def _reader_loop(self, ser: serial.Serial, stop: threading.Event, rx_queue: queue.SimpleQueue,
+                     decode: Optional[Callable[[bytes], Iterable]]):
+        """Read one port session off the GUI thread until stopped or the port fails"""
+        self._flush_input(ser, stop)
+        while not stop.is_set() and self.is_open and ser is self.ser:
+            buf = self._read_burst(ser)
+            if not buf or stop.is_set():
+                continue
+            if decode is None:
+                rx_queue.put(buf)
+            else:
+                for item in decode(buf):
+                    rx_queue.put(item)
 
 
 class PacketProcessor:
@@ -468,56 +726,140 @@ class PacketProcessor:
     ESCAPE_BYTE = b"\b"
     FRAME_END = b"\n"
     FRAME_START = b"\r"
+    ESCAPE_CODE = ESCAPE_BYTE[0]
+    FRAME_END_CODE = FRAME_END[0]
+    FRAME_START_CODE = FRAME_START[0]
     
     def __init__(self):
         self.escape = False
-        self.packet: List[int] = []
+        # Fixed frame buffer; _pos keeps counting past the end so oversized frames are rejected
+        self._buf = array('B', bytes(self.PACKET_LENGTH))
+        self._pos = 0
+    
+    @property
+    def packet(self) -> bytes:
+        """Bytes received so far for the current frame"""
+        return self._buf[:self._pos].tobytes()
     
-    def process_byte(self, data: bytes) -> Optional[List[int]]:
+    def process_byte(self, data: bytes) -> Optional[bytes]:
         """Process incoming byte and return complete packet if available"""
         if not data or len(data) != 1:
-            logger.warning(f"Invalid data received: {data}")
+            logger.warning("Invalid data received: %s", data)
             return None
         
-        byte_val = data[0]
-        
+        return self.process_int(data[0])
+    
+    def process_int(self, byte_val: int) -> Optional[bytes]:
+        """Process one byte value without input validation"""
         if not self.escape:
-            if data == self.ESCAPE_BYTE:
+            if byte_val == self.ESCAPE_CODE:
                 self.escape = True
                 return None
             
-            if data == self.FRAME_START:
-                self.packet = []
+            if byte_val == self.FRAME_START_CODE:
+                self._pos = 0
                 return None
             
-            if data == self.FRAME_END:
-                if len(self.packet) == self.PACKET_LENGTH:
-                    complete_packet = self.packet.copy()
-                    self.packet = []
-                    return complete_packet
-                else:
-                    logger.warning(f"Incomplete packet received: {len(self.packet)} bytes")
-                    self.packet = []
-                    return None
-            
-            self.packet.append(byte_val)
+            if byte_val == self.FRAME_END_CODE:
+                pos, self._pos = self._pos, 0
+                if pos == self.PACKET_LENGTH:
+                    return self._buf.tobytes()
+                logger.warning("Incomplete packet received: %s bytes", pos)
+                return None
         else:
-            self.packet.append(byte_val)
             self.escape = False
         
+        if self._pos < self.PACKET_LENGTH:
+            self._buf[self._pos] = byte_val
+        self._pos += 1
         return None
     
+    # Hot path: runs on every received chunk, so avoid per-byte Python work here
+    def process_bytes(self, buf: bytes) -> List[bytes]:
+        """Process a received chunk and return every packet completed in it"""
+        if not self.escape and self.ESCAPE_BYTE not in buf:
+            return self._process_unescaped(buf)
+        
+        packets = []
+        frame = self._buf
+        pos = self._pos
+        escape = self.escape
+        escape_code = self.ESCAPE_CODE
+        start_code = self.FRAME_START_CODE
+        end_code = self.FRAME_END_CODE
+        length = self.PACKET_LENGTH
+        
+        for byte_val in buf:
+            if not escape:
+                if byte_val == escape_code:
+                    escape = True
+                    continue
+                if byte_val == start_code:
+                    pos = 0
+                    continue
+                if byte_val == end_code:
+                    if pos == length:
+                        packets.append(frame.tobytes())
+                    else:
+                        logger.warning("Incomplete packet received: %s bytes", pos)
+                    pos = 0
+                    continue
+            else:
+                escape = False
+            if pos < length:
+                frame[pos] = byte_val
+            pos += 1
+        
+        self._pos = pos
+        self.escape = escape
+        return packets
+    
+    def _process_unescaped(self, buf: bytes) -> List[bytes]:
+        """Frame a chunk containing no escape bytes with C-level split/rfind"""
+        packets = []
+        length = self.PACKET_LENGTH
+        segments = buf.split(self.FRAME_END)
+        last = len(segments) - 1
+        
+        for index, segment in enumerate(segments):
+            start = segment.rfind(self.FRAME_START)
+            if start >= 0:
+                self._pos = 0
+                segment = segment[start + 1:]
+            pos = self._pos
+            size = pos + len(segment)
+            
+            if index < last:
+                # Segment was closed by a frame end
+                if size == length:
+                    packets.append(self._buf[:pos].tobytes() + segment if pos else segment)
+                else:
+                    logger.warning("Incomplete packet received: %s bytes", size)
+                self._pos = 0
+            else:
+                # Trailing partial frame carries over to the next chunk
+                if pos < length and segment:
+                    self._buf[pos:min(size, length)] = array('B', segment[:length - pos])
+                self._pos = size
+        
+        return packets
+    
     def reset(self):
         """Reset packet parser"""
-        self.packet = []
+        self._pos = 0
         self.escape = False
 
 
+# Precompiled little-endian layout of a sensor frame (device ID is sliced separately)
+_PACKET_STRUCT = struct.Struct('<IBx4xHHH')
+_unpack_packet = _PACKET_STRUCT.unpack_from
+
+
 class SensorDataParser:
     """Parses packet data to extract sensor values"""
     
-    @staticmethod
-    def parse_packet(packet: List[int]) -> Optional[SensorData]:
+    @classmethod
+    def parse_packet(cls, packet: Union[bytes, bytearray, List[int]]) -> Optional[SensorData]:
         """Parse packet and extract sensor data
         
         Byte layout:
@@ -530,87 +872,97 @@ class SensorDataParser:
         12-13: Thermocouple (2 bytes)
         14-15: Battery voltage (2 bytes)
         """
-        if not packet or len(packet) != 16:
-            logger.error(f"Invalid packet length: {len(packet) if packet else 0}")
-            raise ValueError(SensorErrorType.INVALID_PACKET_LENGTH.value)
+        if not packet or len(packet) != _PACKET_STRUCT.size:
+            logger.error("Invalid packet length: %s", len(packet) if packet else 0)
+            raise ValueError(_INVALID_PACKET_LENGTH_MSG)
         
         try:
-            # Parse temperature from bytes 1-4 (4 bytes, big-endian)
-            temp = packet[3]
-            temp = (temp << 8) | packet[2]
-            temp = (temp << 8) | packet[1]
-            temp = (temp << 8) | packet[0]
-            temp = temp / 10000.0
-            for i, b in enumerate(packet):
-             print(f"Byte {i}: {b}")
-            
-            if temp < -100 or temp > 100:
-                logger.warning(f"Temperature out of reasonable range: {temp}")
-
-            # Parse RSSI from byte 4
-            rssi = packet[4]
-
-            # Parse device ID from bytes 7-9 (3 bytes)
-            device_id = f"{packet[6]:02x} {packet[7]:02x} {packet[8]:02x} {packet[9]:02x}"
-            
-            # Parse RTD from bytes 10-11 (2 bytes, big-endian)
-            rtd = packet[11]
-            rtd = (rtd << 8) | packet[10]
-            rtd_resistance = (rtd * 400) / (2**15)
-            
-            if rtd_resistance < 0:
-                logger.error(f"Negative RTD resistance: {rtd_resistance}")
-                raise ValueError("RTD resistance cannot be negative")
-            
-            try:
-                rtd_temperature = RTDTemperatureTable.get_temperature_from_resistance(rtd_resistance)
-            except ValueError as e:
-                logger.error(f"Failed to convert RTD: {e}")
-                rtd_temperature = 0
-            
-            # Parse thermocouple from bytes 12-13 (2 bytes, big-endian)
-            thermo_raw = packet[13]
-            thermo_raw = (thermo_raw << 8) | packet[12]
-            thermo = (thermo_raw * 1.2) / (32 * 2**15)
-            
-            # Parse battery voltage from bytes 14-15 (2 bytes, big-endian)
-            battery_voltage = ((packet[15] << 8) | packet[14]) / 1000.0
-            
-    
-    
-            
-            if battery_voltage < 0 or battery_voltage > 10:
-                logger.warning(f"Battery voltage out of range: {battery_voltage}")
-            
-            sensor_data = SensorData(
-                temperature=temp,
-                device_id=device_id,
-                rtd_resistance=rtd_resistance,
-                rtd_temperature=rtd_temperature,
-                thermocouple=thermo,
-                battery_voltage=battery_voltage,
-                rssi=rssi,
-                raw_packet=packet
-            )
-            
-            if not sensor_data.is_valid():
-                logger.error("Parsed sensor data validation failed")
-                raise ValueError("Invalid sensor data")
-            
-            logger.info(f"Successfully parsed packet: temp={temp}, rtd={rtd_resistance:.3f}, battery={battery_voltage}V")
-            return sensor_data
+            if not isinstance(packet, (bytes, bytearray)):
+                packet = bytes(packet)
+            return cls._parse_fast(packet, *_unpack_packet(packet))
         
         except (IndexError, struct.error, ValueError) as e:
-            logger.error(f"Error parsing packet: {e}")
+            logger.error("Error parsing packet: %s", e)
             raise ValueError(f"Packet parsing error: {e}")
         except Exception as e:
-            logger.error(f"Unexpected error parsing packet: {e}")
+            logger.error("Unexpected error parsing packet: %s", e)
             raise ValueError(f"Unexpected parsing error: {e}")
+    
+    @classmethod
+    def parse_packets(cls, packets: List[bytes]) -> List[SensorData]:
+        """Parse a burst of frames, logging and skipping any that fail
+        
+        Frames of the expected length are unpacked together in one iter_unpack
+        pass over the joined burst.
+        """
+        buf = b"".join(packets)
+        if len(buf) != _PACKET_STRUCT.size * len(packets):
+            fields = [None] * len(packets)
+        else:
+            fields = _PACKET_STRUCT.iter_unpack(buf)
+        
+        readings = []
+        for packet, values in zip(packets, fields):
+            try:
+                if values is None:
+                    readings.append(cls.parse_packet(packet))
+                else:
+                    readings.append(cls._parse_fast(packet, *values))
+            except ValueError as e:
+                logger.error("Parse error: %s", e)
+        return readings
+    
+    # Hot path: shared by parse_packet and parse_packets for every frame; I/O and
+    # interpreter overhead dominate, so keep this to one unpack and table lookups
+    @staticmethod
+    def _parse_fast(packet: bytes, temp_raw: int, rssi: int, rtd: int,
+                    thermo_raw: int, battery_raw: int) -> SensorData:
+        """Build a reading from a frame and its already unpacked little-endian fields"""
+        # Temperature from bytes 0-3 in 0.0001 units
+        temp = temp_raw / 10000.0
+        
+        if not -100 <= temp <= 100:
+            logger.warning("Temperature out of reasonable range: %s", temp)
+
+        # Device ID from bytes 6-9 (4 bytes)
+        device_id = packet[6:10].hex(' ')
+        
+        # RTD from bytes 10-11; raw values past the table are above the 850 degC limit
+        rtd_resistance = (rtd * 400) / (2**15)
+        rtd_temperature = _RTD_RAW_LUT[rtd] if rtd < _RTD_RAW_LIMIT else float(_CVD_T_MAX)
+        
+        # Thermocouple from bytes 12-13
+        thermo = (thermo_raw * 1.2) / (32 * 2**15)
+        
+        # Battery voltage from bytes 14-15 in millivolts
+        battery_voltage = battery_raw / 1000.0
+        
+        # The only range the parser cannot guarantee by construction
+        if not 0 <= battery_voltage <= 10:
+            logger.error("Battery voltage out of range: %s", battery_voltage)
+            raise ValueError("Invalid sensor data")
+        
+        sensor_data = SensorData(
+            temperature=temp,
+            device_id=device_id,
+            rtd_resistance=rtd_resistance,
+            rtd_temperature=rtd_temperature,
+            thermocouple=thermo,
+            battery_voltage=battery_voltage,
+            rssi=rssi,
+            raw_packet=packet
+        )
+        
+        logger.debug("Successfully parsed packet: temp=%s, rtd=%.3f, battery=%sV", temp, rtd_resistance, battery_voltage)
+        return sensor_data
 
 
 class SensorGUI(tk.Tk):
     """GUI for wireless sensor data logger with professional ACUCAST-style interface"""
     
+    # How often queued hot-plug events are checked
+    PORT_EVENT_POLL_MS = 250
+    
     def __init__(self):
         super().__init__()
         self.title("WIRELESS SENSOR - MOLTEN METAL CONTINUOUS TEMPERATURE SYSTEM")
@@ -621,6 +973,8 @@ class SensorGUI(tk.Tk):
         self.port_manager = SerialPortManager()
         self.packet_processor = PacketProcessor()
         self.data_parser = SensorDataParser()
+        self.frame_buffer = SensorFrameBuffer()
+        self.rx_queue: queue.SimpleQueue = queue.SimpleQueue()
         
         self.current_temp = tk.StringVar(value="--")
         self.device_id_val = tk.StringVar(value="NOT PAIRED")
@@ -642,6 +996,52 @@ class SensorGUI(tk.Tk):
             frame.grid(row=0, column=0, sticky="nsew")
         
         self.show_frame("DashboardFrame")
+        # Hot-plug events are queued by the monitor thread and handled on the Tk thread
+        self._port_events = queue.SimpleQueue()
+        self._port_observer = self._start_port_monitor()
+        if self._port_observer is not None:
+            self._poll_port_events()
+    
+    def _start_port_monitor(self):
+        """Watch tty hot-plug events when pyudev is available instead of polling comports()"""
+        if pyudev is None or not sys.platform.startswith('linux'):
+            return None
+        try:
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by('tty')
+            observer = pyudev.MonitorObserver(monitor, callback=self._on_port_event, name='port-monitor')
+            observer.daemon = True
+            observer.start()
+            return observer
+        except Exception as e:
+            logger.warning("Port hot-plug monitor unavailable: %s", e)
+            return None
+    
+    def _on_port_event(self, device):
+        """Runs on the monitor thread; only queue the event, Tk may already be gone"""
+        self._port_events.put(device)
+    
+    def _poll_port_events(self):
+        """Refresh the port list once for all hot-plug events since the last poll"""
+        seen = False
+        try:
+            while True:
+                self._port_events.get_nowait()
+                seen = True
+        except queue.Empty:
+            pass
+        if seen:
+            self.port_manager.invalidate_ports()
+            self.frames["DashboardFrame"].update_ports()
+        self.after(self.PORT_EVENT_POLL_MS, self._poll_port_events)
+    
+    def destroy(self):
+        """Stop the hot-plug monitor before tearing down the window"""
+        observer = getattr(self, '_port_observer', None)
+        if observer is not None:
+            self._port_observer = None
+            observer.stop()
+        super().destroy()
     
     def show_frame(self, name):
         """Show specified frame"""
@@ -652,9 +1052,38 @@ class SensorGUI(tk.Tk):
 class DashboardFrame(tk.Frame):
     """Main dashboard display - Full Screen"""
     
+    # Display poll interval (~60 Hz); readings arriving faster are buffered, not drawn
+    REFRESH_MS = 16
+    # Poll interval while a port scan is running
+    PORT_POLL_MS = 50
+    
+    # Reading formatters bound once to their %-templates
+    _TEMP_FMT = "%.1f".__mod__
+    _BATT_FMT = "%.2fV".__mod__
+    _RSSI_FMT = "RSSI: %d dBm".__mod__
+    _BAT_HEADER_FMT = "BAT %s%%".__mod__
+    _RSSI_HEADER_FMT = "RSSI %s".__mod__
+    
     def __init__(self, parent, controller):
         super().__init__(parent, bg="#1a1a1a")
         self.controller = controller
+        self.bat_text = tk.StringVar(value="BAT --%")
+        self.rssi_text = tk.StringVar(value="RSSI --")
+        # Display variable setters in _process_data order, bound once, and the last text each was given
+        self._setters = tuple(var.set for var in (
+            controller.current_temp, controller.device_id_val, controller.rtd_temp,
+            controller.thermo_val, controller.battery_val, controller.rssi_val,
+            self.bat_text, self.rssi_text))
+        self._shown = [None] * len(self._setters)
+        # Only the first failed open in a row raises a modal dialog
+        self._open_failed = False
+        # Pending _read_data timer, so a reconnect never runs two drain loops
+        self._read_job = None
+        # Port scans run off the Tk thread; results come back through this queue
+        self._port_scan = None
+        self._port_results = queue.SimpleQueue()
+        # Set when a refresh arrives mid-scan; that scan may predate the change
+        self._rescan_pending = False
         self.grid_rowconfigure(1, weight=1)
         self.grid_columnconfigure(0, weight=1)
         
@@ -686,21 +1115,21 @@ class DashboardFrame(tk.Frame):
         self.lbl_date = tk.Label(center_info, text="DD-MMM-YYYY", fg="#666666", bg="#e6e6e6", 
                                 font=("Arial", 11))
         self.lbl_date.pack()
+        tk.Label(center_info, textvariable=controller.status_msg, fg="#666666", bg="#e6e6e6",
+                font=("Arial", 10)).pack()
         self.update_clock()
         
         # Battery and RSSI (right side)
         right_info = tk.Frame(header, bg="#e6e6e6")
         right_info.pack(side="right", padx=30, pady=15)
         
-        self.lbl_bat = tk.Label(right_info, text="BAT --%", fg="#333333", bg="#e6e6e6", 
+        self.lbl_bat = tk.Label(right_info, textvariable=self.bat_text, fg="#333333", bg="#e6e6e6", 
                 font=("Arial", 20, "bold"))
         self.lbl_bat.pack(anchor="e")
-        controller.battery_val.trace_add('write', lambda *args: self.lbl_bat.config(text=f"BAT {controller.battery_val.get()}%"))
         
-        self.lbl_rssi = tk.Label(right_info, text="RSSI --", fg="#0055aa", bg="#e6e6e6", 
+        self.lbl_rssi = tk.Label(right_info, textvariable=self.rssi_text, fg="#0055aa", bg="#e6e6e6", 
                 font=("Arial", 20, "bold"))
         self.lbl_rssi.pack(anchor="e")
-        controller.rssi_val.trace_add('write', lambda *args: self.lbl_rssi.config(text=f"RSSI {controller.rssi_val.get()}"))
         
         # Main content area
         self.main_container = tk.Frame(self, bg="#ffffff")
@@ -799,11 +1228,32 @@ class DashboardFrame(tk.Frame):
         self.after(1000, self.update_clock)
     
     def update_ports(self):
-        """Update available ports"""
-        ports = self.controller.port_manager.get_available_ports()
+        """Scan for ports on a worker thread; the list is filled in when the scan finishes"""
+        if self._port_scan is not None and self._port_scan.is_alive():
+            self._rescan_pending = True
+            return
+        scan_ports = self.controller.port_manager.get_available_ports
+        self._port_scan = threading.Thread(target=lambda: self._port_results.put(scan_ports()),
+                                           daemon=True, name='port-scan')
+        self._port_scan.start()
+        self._poll_port_scan()
+    
+    def _poll_port_scan(self):
+        """Fill the port list once the background scan has reported"""
+        try:
+            ports = self._port_results.get_nowait()
+        except queue.Empty:
+            self.after(self.PORT_POLL_MS, self._poll_port_scan)
+            return
+        selected = self.combo.get()
         self.combo['values'] = ports if ports else []
-        if ports:
+        if ports and selected not in ports:
             self.combo.current(0)
+        if self._rescan_pending:
+            # The finished scan may have cached a list from before the refresh request
+            self._rescan_pending = False
+            self.controller.port_manager.invalidate_ports()
+            self.update_ports()
     
     def _open_port(self):
         """Open selected port"""
@@ -812,56 +1262,92 @@ class DashboardFrame(tk.Frame):
             messagebox.showerror("Error", "Select a port")
             return
         
+        if self.controller.is_reading or self.controller.port_manager.is_open:
+            # Connecting again switches ports: end the current session first
+            self._close_port()
+        
         success, msg = self.controller.port_manager.open_port(sel)
+        self.controller.status_msg.set(msg)
         if success:
+            self._open_failed = False
             self.controller.device_id_val.set(sel)
             self.controller.is_paired.set(True)
             self.controller.is_reading = True
+            self.controller.rx_queue = queue.SimpleQueue()
+            self.controller.packet_processor.reset()
+            self._shown = [None] * len(self._setters)
+            self.controller.port_manager.start_reader(self.controller.rx_queue, self._decode_chunk)
             self._read_data()
-        else:
+        elif not self._open_failed:
+            self._open_failed = True
             messagebox.showerror("Error", msg)
     
     def _close_port(self):
         """Close port"""
+        if self._read_job is not None:
+            self.after_cancel(self._read_job)
+            self._read_job = None
         self.controller.port_manager.close_port()
         self.controller.is_reading = False
         self.controller.is_paired.set(False)
         self.controller.device_id_val.set("NOT PAIRED")
         self.controller.packet_processor.reset()
     
+    def _decode_chunk(self, buf: bytes) -> List[SensorData]:
+        """Frame and parse a received chunk; runs on the reader thread, so no Tk calls"""
+        packets = self.controller.packet_processor.process_bytes(buf)
+        return self.controller.data_parser.parse_packets(packets) if packets else []
+    
     def _read_data(self):
-        """Read from serial port"""
-        if not self.controller.is_reading or not self.controller.port_manager.is_open:
+        """Buffer every reading decoded by the reader thread and display the newest"""
+        self._read_job = None
+        if not self.controller.is_reading:
             return
         
+        rx_queue = self.controller.rx_queue
+        frame_buffer = self.controller.frame_buffer
+        latest = None
         try:
-            data = self.controller.port_manager.read_byte()
-            if data:
-                packet = self.controller.packet_processor.process_byte(data)
-                if packet:
-                    self._process_data(packet)
+            while True:
+                try:
+                    latest = rx_queue.get_nowait()
+                except queue.Empty:
+                    break
+                frame_buffer.append(latest)
+            if latest is not None:
+                self._process_data(latest)
         except Exception as e:
-            logger.error(f"Read error: {e}")
+            logger.error("Read error: %s", e)
+        
+        if not self.controller.port_manager.is_open:
+            # The reader thread marks the port closed when a serial read fails
+            self._close_port()
+            self.controller.status_msg.set("Device disconnected")
+            return
         
         if self.controller.is_reading:
-            self.after(1, self._read_data)
+            self._read_job = self.after(self.REFRESH_MS, self._read_data)
     
-    def _process_data(self, packet):
+    def _process_data(self, data: SensorData):
         """Process sensor data"""
-        try:
-            data = self.controller.data_parser.parse_packet(packet)
-            
-            # Print room temperature
-           
-            
-            self.controller.current_temp.set(f"{data.temperature:.1f}")
-            self.controller.device_id_val.set(data.device_id)
-            self.controller.rtd_temp.set(str(data.rtd_temperature))
-            self.controller.thermo_val.set(str(data.thermocouple))
-            self.controller.battery_val.set(f"{data.battery_voltage:.2f}V")
-            self.controller.rssi_val.set(f"RSSI: {data.rssi} dBm")
-        except ValueError as e:
-            logger.error(f"Parse error: {e}")
+        battery = self._BATT_FMT(data.battery_voltage)
+        rssi = self._RSSI_FMT(data.rssi)
+        texts = (
+            self._TEMP_FMT(data.temperature),
+            data.device_id,
+            self._TEMP_FMT(data.rtd_temperature),
+            str(data.thermocouple),
+            battery,
+            rssi,
+            self._BAT_HEADER_FMT(battery),
+            self._RSSI_HEADER_FMT(rssi),
+        )
+        # Only changed fields pay for the Tcl round trip
+        shown = self._shown
+        for index, (setter, text) in enumerate(zip(self._setters, texts)):
+            if shown[index] != text:
+                setter(text)
+                shown[index] = text
     
     def check_password(self):
         """Check password"""